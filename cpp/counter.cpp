@@ -7,12 +7,33 @@
 
 namespace retracesoftware {
 
+    struct Counter;
+
+    static FreeList<Counter, 64> Counter_FreeList;
+
     struct Counter : public PyObject { 
         uint64_t value;
         vectorcallfunc vectorcall;
+        PyObject * weakreflist;
 
         static void dealloc(Counter *self) {
-            Py_TYPE(self)->tp_free((PyObject *)self);  // Free the object
+            if (self->weakreflist) {
+                PyObject_ClearWeakRefs(self);
+            }
+            Counter_FreeList.release(self);
+        }
+
+        static PyObject * create(PyTypeObject * cls, PyObject * args, PyObject * kwargs) {
+            Counter * self = cls == &Counter_Type ? Counter_FreeList.pop(cls) : nullptr;
+
+            if (!self) {
+                self = (Counter *)PyType_GenericNew(cls, args, kwargs);
+                if (!self) return nullptr;
+            }
+            // a recycled counter still holds its previous value
+            self->value = 0;
+            self->vectorcall = (vectorcallfunc)next_impl;
+            return self;
         }
 
         static int init(Counter *self, PyObject *args, PyObject *kwds) {
@@ -36,6 +57,11 @@ namespace retracesoftware {
         static PyObject * next_impl(Counter * self, PyObject** args, size_t nargsf, PyObject* kwnames) {
             return PyLong_FromUnsignedLongLong(self->next());
         }
+
+        // current value, without advancing
+        static PyObject * index(Counter * self) {
+            return PyLong_FromUnsignedLongLong(self->value);
+        }
     };
 
     struct BlockingCounter : public PyObject {
@@ -118,6 +144,11 @@ namespace retracesoftware {
         {NULL}  /* Sentinel */
     };
 
+    static PyNumberMethods as_number = {
+        .nb_int = (unaryfunc)Counter::index,
+        .nb_index = (unaryfunc)Counter::index,
+    };
+
     PyTypeObject Counter_Type = {
         .ob_base = PyVarObject_HEAD_INIT(NULL, 0)
         .tp_name = MODULE "counter",
@@ -125,13 +156,15 @@ namespace retracesoftware {
         .tp_itemsize = 0,
         .tp_dealloc = (destructor)Counter::dealloc,
         .tp_vectorcall_offset = OFFSET_OF_MEMBER(Counter, vectorcall),
+        .tp_as_number = &as_number,
         .tp_call = PyVectorcall_Call,
         .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_VECTORCALL,
         .tp_doc = "TODO",
+        .tp_weaklistoffset = OFFSET_OF_MEMBER(Counter, weakreflist),
         // .tp_methods = methods,
         .tp_members = members,
         .tp_init = (initproc)Counter::init,
-        .tp_new = PyType_GenericNew,
+        .tp_new = Counter::create,
     };
 
     uint64_t Counter_Next(PyObject * counter) {
@@ -8,23 +8,23 @@ using namespace ankerl::unordered_dense;
 
 namespace retracesoftware {
 
-    static map<PyObject *, PyObject *> on_set;
+    // transform per intercepted dict, with its vectorcall entry cached
+    static map<PyObject *, FastCall> on_set;
     // static map<PyObject *, PyObject *> on_get;
     
     static int set_item(PyObject * dict, PyObject *key, PyObject *value) {
 
         if (value) {
-            assert(on_set.contains(dict));
+            auto it = on_set.find(dict);
+            assert(it != on_set.end());
 
-            PyObject * setter = on_set[dict];
-
-            PyObject * new_value = PyObject_CallFunctionObjArgs(setter, key, value, nullptr);
-
-            Py_DECREF(value);
+            PyObject * args[] = {key, value};
+            PyObject * new_value = it->second(args, 2, nullptr);
 
             if (!new_value) return -1;
 
-            int result = PyDict_Type.tp_as_mapping->mp_ass_subscript(dict, key, new_value);
+            // PyDict_SetItem reuses the hash cached on str keys
+            int result = PyDict_SetItem(dict, key, new_value);
             Py_DECREF(new_value);
             return result;
         } else {
@@ -40,16 +40,15 @@ namespace retracesoftware {
         return PyDict_Type.tp_as_mapping->mp_length(self);
     }
 
+    // Both types are static, so the swap needs no type refcounting
     static void set_type(PyObject * obj, PyTypeObject * cls) {
-        Py_DECREF(obj->ob_type);
-        Py_INCREF(cls);
-        obj->ob_type = cls;
+        Py_SET_TYPE(obj, cls);
     }
 
     static void dealloc(PyObject *self) {
         auto it = on_set.find(self);
 
-        Py_DECREF(it->second);
+        Py_DECREF(it->second.callable);
         on_set.erase(it);
 
         PyDict_Type.tp_dealloc(self);
@@ -65,7 +64,7 @@ namespace retracesoftware {
         if (Py_TYPE(dict) == &PyDict_Type) {
             if (on_set == Py_None) return true;
 
-            retracesoftware::on_set[dict] = Py_NewRef(on_set);
+            retracesoftware::on_set[dict] = FastCall(Py_NewRef(on_set));
             set_type(dict, &DictIntercept_Type);
             return true;
         } else if (Py_TYPE(dict) == &DictIntercept_Type) {
@@ -74,22 +73,62 @@ namespace retracesoftware {
             
             assert (it != retracesoftware::on_set.end());
 
-            Py_DECREF(it->second);
+            Py_DECREF(it->second.callable);
 
             if (on_set == Py_None) {
                 retracesoftware::on_set.erase(it);
                 set_type(dict, &PyDict_Type);
             } else {
-                it->second = Py_NewRef(on_set);
+                it->second = FastCall(Py_NewRef(on_set));
             }
             return true;
 
         } else {
-            PyErr_Format(PyExc_TypeError, "");
+            PyErr_Format(PyExc_TypeError, "can only intercept an exact dict, not %S", Py_TYPE(dict));
             return false;
         }
     }
 
+    // Walk a plain dict in place rather than materialising its keys first
+    static bool update_from_dict(PyObject * self, PyObject * other) {
+        Py_ssize_t pos = 0, size = PyDict_GET_SIZE(other);
+        PyObject *key, *value;
+
+        while (PyDict_Next(other, &pos, &key, &value)) {
+            Py_INCREF(key);
+            Py_INCREF(value);
+            int status = PyObject_SetItem(self, key, value);
+            Py_DECREF(key);
+            Py_DECREF(value);
+            if (status < 0) return false;
+
+            if (PyDict_GET_SIZE(other) != size) {
+                PyErr_SetString(PyExc_RuntimeError, "dict changed size during update");
+                return false;
+            }
+        }
+        return true;
+    }
+
+    // As in dict.update, having a 'keys' attribute is what makes the argument
+    // a mapping rather than an iterable of pairs. Returns -1 on error.
+    static int has_keys(PyObject * other) {
+        static PyObject * name = PyUnicode_InternFromString("keys");
+        if (!name) return -1;
+#if PY_VERSION_HEX >= 0x030D0000
+        return PyObject_HasAttrWithError(other, name);
+#else
+        PyObject * attr = PyObject_GetAttr(other, name);
+        if (attr) {
+            Py_DECREF(attr);
+            return 1;
+        }
+        if (!PyErr_ExceptionMatches(PyExc_AttributeError)) return -1;
+        PyErr_Clear();
+        return 0;
+#endif
+    }
+
     static PyObject * update(PyObject *self, PyObject *args, PyObject *kwds)
     {
         PyObject *other = NULL;
@@ -100,11 +139,15 @@ namespace retracesoftware {
         }
 
         // Handle 'other' if provided
-        if (other != NULL) {
-            // If 'other' is a mapping, use keys() and getitem
-            PyObject *keys = PyMapping_Keys(other);
-            if (keys == NULL) {
-                // If not a mapping, try treating as an iterable
+        if (other != NULL && PyDict_CheckExact(other)) {
+            if (!update_from_dict(self, other)) return NULL;
+        } else if (other != NULL) {
+            int mapping = has_keys(other);
+            if (mapping < 0) {
+                return NULL;
+            }
+            if (!mapping) {
+                // Not a mapping, treat as an iterable of pairs
                 PyObject *iter = PyObject_GetIter(other);
                 if (iter == NULL) {
                     PyErr_SetString(PyExc_TypeError,
@@ -134,7 +177,11 @@ namespace retracesoftware {
                     return NULL;
                 }
             } else {
-                // 'other' is a mapping; iterate over keys
+                // 'other' is a mapping, use keys() and getitem
+                PyObject *keys = PyMapping_Keys(other);
+                if (keys == NULL) {
+                    return NULL;
+                }
                 PyObject *iter = PyObject_GetIter(keys);
                 Py_DECREF(keys);
                 if (iter == NULL) {
@@ -166,36 +213,8 @@ namespace retracesoftware {
         }
 
         // Handle keyword arguments if provided
-        if (kwds != NULL && PyDict_Check(kwds)) {
-            PyObject *keys = PyDict_Keys(kwds);
-            if (keys == NULL) {
-                return NULL;
-            }
-            PyObject *iter = PyObject_GetIter(keys);
-            Py_DECREF(keys);
-            if (iter == NULL) {
-                return NULL;
-            }
-            PyObject *key;
-            while ((key = PyIter_Next(iter))) {
-                PyObject *value = PyDict_GetItem(kwds, key);  // Borrowed reference
-                if (value == NULL) {
-                    Py_DECREF(key);
-                    Py_DECREF(iter);
-                    return NULL;
-                }
-                // Call mp_ass_subscript via PyObject_SetItem
-                if (PyObject_SetItem(self, key, value) < 0) {
-                    Py_DECREF(key);
-                    Py_DECREF(iter);
-                    return NULL;
-                }
-                Py_DECREF(key);
-            }
-            Py_DECREF(iter);
-            if (PyErr_Occurred()) {
-                return NULL;
-            }
+        if (kwds != NULL && !update_from_dict(self, kwds)) {
+            return NULL;
         }
 
         Py_RETURN_NONE;
@@ -34,8 +34,12 @@ namespace retracesoftware {
     // pointer comparison. The cache owns a strong reference to the
     // executor, avoiding dict operations on the hot path entirely.
     //
-    // A CacheSentinel object in each thread's dict invalidates the cache
-    // when the thread exits, preventing stale-pointer access.
+    // The cache is a small direct-mapped table indexed by the Gate's
+    // address, so code alternating between a few gates does not evict
+    // (and write back to the thread dict) on every call.
+    //
+    // A CacheSentinel object in each thread's dict invalidates that
+    // thread's cache entries when it exits, preventing stale-pointer access.
     // ========================================================================
 
     struct GateCache {
@@ -44,17 +48,29 @@ namespace retracesoftware {
         FastCall executor;       // cached executor (callable == NULL => disabled)
     };
 
-    static GateCache cache = {nullptr, nullptr, {}};
+    static const size_t GATE_CACHE_SIZE = 8;   // power of two
+
+    static GateCache cache[GATE_CACHE_SIZE] = {};
 
     // Private key for the sentinel in each thread dict.
     static PyObject * sentinel_key = nullptr;
 
+    // Fixed reprs (e.g. "<Gate disabled>") are built once and shared.
+    static PyObject * constant_repr(PyObject ** cached, const char * text) {
+        if (!*cached) *cached = PyUnicode_InternFromString(text);
+        return Py_XNewRef(*cached);
+    }
+
     struct CacheSentinel : public PyObject {
         PyObject * dict;
 
         static void dealloc(CacheSentinel * self) {
-            if (cache.dict == self->dict) {
-                cache = {nullptr, nullptr, {}};
+            for (size_t i = 0; i < GATE_CACHE_SIZE; i++) {
+                if (cache[i].dict == self->dict) {
+                    PyObject * exec = cache[i].executor.callable;
+                    cache[i] = {nullptr, nullptr, {}};
+                    Py_XDECREF(exec);
+                }
             }
             Py_TYPE(self)->tp_free((PyObject *)self);
         }
@@ -64,6 +80,12 @@ namespace retracesoftware {
         vectorcallfunc vectorcall;
         PyObject * default_executor;  // used when thread dict has no entry; NULL = disabled
 
+        // Gates are fixed-size allocations, so dividing by the size maps
+        // neighbouring gates to neighbouring slots.
+        inline GateCache & cache_slot() {
+            return cache[((uintptr_t)this / sizeof(Gate)) & (GATE_CACHE_SIZE - 1)];
+        }
+
         static void ensure_sentinel(PyObject * dict) {
             if (!sentinel_key) {
                 sentinel_key = PyUnicode_InternFromString("__retrace_gate_sentinel__");
@@ -83,16 +105,16 @@ namespace retracesoftware {
             Py_DECREF(s);
         }
 
-        // Write cached executor back to cache.dict (which may belong to
+        // Write a cached executor back to its dict (which may belong to
         // another thread — safe under the GIL). Called on cache eviction
-        // or Gate::dealloc (cold path only).
+        // (cold path only).
         __attribute__((noinline))
-        static void flush_to_dict() {
-            if (!cache.dict || !cache.gate) return;
+        static void flush_to_dict(GateCache & entry) {
+            if (!entry.dict || !entry.gate) return;
 
-            PyObject * dict = cache.dict;
-            Gate * gate = cache.gate;
-            PyObject * exec = cache.executor.callable;
+            PyObject * dict = entry.dict;
+            Gate * gate = entry.gate;
+            PyObject * exec = entry.executor.callable;
 
             if (exec) {
                 PyDict_SetItem(dict, (PyObject *)gate, exec);
@@ -110,10 +132,10 @@ namespace retracesoftware {
 
         // Slow path: flush old cache, install sentinel, load from new dict.
         __attribute__((noinline))
-        void load_cache(PyObject * dict) {
-            flush_to_dict();
+        void load_cache(GateCache & entry, PyObject * dict) {
+            flush_to_dict(entry);
 
-            Py_XDECREF(cache.executor.callable);
+            Py_XDECREF(entry.executor.callable);
 
             ensure_sentinel(dict);
 
@@ -124,50 +146,58 @@ namespace retracesoftware {
             }
 
             Py_XINCREF(exec);
-            cache.dict = dict;   // borrowed
-            cache.gate = this;
-            cache.executor = exec ? FastCall(exec) : FastCall();
+            entry.dict = dict;   // borrowed
+            entry.gate = this;
+            entry.executor = exec ? FastCall(exec) : FastCall();
         }
 
-        inline PyObject * executor() {
+        // Returns this gate's cache entry, loaded for the current thread
+        inline GateCache & current() {
+            GateCache & entry = cache_slot();
             PyObject * dict = PyThreadState_GetDict();
-            if (__builtin_expect(cache.dict != dict || cache.gate != this, 0)) {
-                load_cache(dict);
+            if (__builtin_expect(entry.dict != dict || entry.gate != this, 0)) {
+                load_cache(entry, dict);
             }
-            return cache.executor.callable;
+            return entry;
+        }
+
+        inline PyObject * executor() {
+            return current().executor.callable;
         }
 
         // Hot path: INCREF/DECREF + assign — zero dict operations.
         void set_executor(PyObject * exec) {
-            PyObject * dict = PyThreadState_GetDict();
-            if (__builtin_expect(cache.dict != dict || cache.gate != this, 0)) {
-                load_cache(dict);
-            }
+            GateCache & entry = current();
 
             if (!exec && this->default_executor)
                 exec = this->default_executor;
 
             Py_XINCREF(exec);
-            Py_XDECREF(cache.executor.callable);
-            cache.executor = exec ? FastCall(exec) : FastCall();
+            Py_XDECREF(entry.executor.callable);
+            entry.executor = exec ? FastCall(exec) : FastCall();
         }
 
         // --- Python methods ---
 
         static int init(Gate * self, PyObject * args, PyObject * kwds) {
-            self->default_executor = nullptr;
             static const char * kwlist[] = {"default", NULL};
             PyObject * default_exec = nullptr;
-            if (!PyArg_ParseTupleAndKeywords(args, kwds, "|O:Gate", (char **)kwlist, &default_exec)) {
+            if (!PyArg_ParseTupleAndKeywords(args, kwds, "|$O:Gate", (char **)kwlist, &default_exec)) {
                 return -1;
             }
-            if (default_exec != nullptr && default_exec != Py_None) {
-                if (!PyCallable_Check(default_exec)) {
-                    PyErr_Format(PyExc_TypeError, "Gate default must be callable or None, got %S", default_exec);
-                    return -1;
-                }
-                self->default_executor = Py_NewRef(default_exec);
+            // Other threads' cache slots hold the default as their effective
+            // executor, so it cannot be changed after the fact
+            if (self->vectorcall) {
+                PyErr_Format(PyExc_TypeError, "%S is already initialized", Py_TYPE(self));
+                return -1;
+            }
+            if (default_exec == Py_None) {
+                default_exec = nullptr;
+            } else if (default_exec && !PyCallable_Check(default_exec)) {
+                PyErr_Format(PyExc_TypeError, "Gate default must be callable or None, got %S", default_exec);
+                return -1;
             }
+            self->default_executor = Py_XNewRef(default_exec);
             self->vectorcall = (vectorcallfunc)Gate::call;
             return 0;
         }
@@ -228,14 +258,16 @@ namespace retracesoftware {
             if (exec) {
                 return PyUnicode_FromFormat("<Gate executor=%R>", exec);
             } else {
-                return PyUnicode_FromString("<Gate disabled>");
+                static PyObject * disabled = nullptr;
+                return constant_repr(&disabled, "<Gate disabled>");
             }
         }
 
         static void dealloc(Gate * self) {
-            if (cache.gate == self) {
-                Py_XDECREF(cache.executor.callable);
-                cache = {nullptr, nullptr, {}};
+            GateCache & entry = self->cache_slot();
+            if (entry.gate == self) {
+                Py_XDECREF(entry.executor.callable);
+                entry = {nullptr, nullptr, {}};
             }
             Py_CLEAR(self->default_executor);
             Py_TYPE(self)->tp_free((PyObject *)self);
@@ -245,35 +277,33 @@ namespace retracesoftware {
     // ========================================================================
     // BoundGate — thin wrapper returned by gate.bind(target).
     //
-    // Hot path (disabled, single global Gate, same thread):
+    // Hot path (disabled, same thread):
     //   1. PyThreadState_GetDict()      — read current thread's dict pointer
-    //   2. cache.dict == dict?          — pointer compare (almost always true)
-    //   3. cache.gate == gate?          — pointer compare (always true for single gate)
-    //   4. cache.executor.callable?     — NULL check
+    //   2. entry.dict == dict?          — pointer compare (almost always true)
+    //   3. entry.gate == gate?          — pointer compare (true unless two live
+    //                                     gates share a cache slot)
+    //   4. entry.executor.callable?     — NULL check
     //   5. self->target.vectorcall(...) — indirect call via cached pointer
     //
     // Hot path (active executor, PY_VECTORCALL_ARGUMENTS_OFFSET set):
     //   Steps 1-3 same, then:
     //   4. Write target into args[-1]   — reuse caller's offset slot
-    //   5. cache.executor.vectorcall(...)— indirect call via cached pointer
+    //   5. entry.executor.vectorcall(...)— indirect call via cached pointer
     //   6. Restore args[-1]
     //   Zero alloca, zero memcpy.
     // ========================================================================
 
+    static FreeList<BoundGate, 256> BoundGate_FreeList;
+
     struct BoundGate : public PyObject {
         Gate * gate;
         FastCall target;
         vectorcallfunc vectorcall;
 
         static PyObject * call(BoundGate * self, PyObject ** args, size_t nargsf, PyObject * kwnames) {
-            Gate * gate = self->gate;
-            PyObject * dict = PyThreadState_GetDict();
-
-            if (__builtin_expect(cache.dict != dict || cache.gate != gate, 0)) {
-                gate->load_cache(dict);
-            }
+            GateCache & entry = self->gate->current();
 
-            if (cache.executor.callable == nullptr) {
+            if (__builtin_expect(entry.executor.callable == nullptr, 1)) {
                 // Disabled — direct passthrough via cached vectorcall pointer
                 return self->target(args, nargsf, kwnames);
             }
@@ -288,7 +318,7 @@ namespace retracesoftware {
                 PyObject * saved = args[-1];
                 args[-1] = self->target.callable;
                 // Don't propagate offset flag — we don't own args[-2]
-                PyObject * result = cache.executor(args - 1, nargs + 1, kwnames);
+                PyObject * result = entry.executor(args - 1, nargs + 1, kwnames);
                 args[-1] = saved;
                 return result;
             }
@@ -304,7 +334,7 @@ namespace retracesoftware {
                 memcpy(new_args + 2, args, (size_t)total * sizeof(PyObject *));
             }
 
-            return cache.executor(new_args + 1,
+            return entry.executor(new_args + 1,
                                   (nargs + 1) | PY_VECTORCALL_ARGUMENTS_OFFSET, kwnames);
         }
 
@@ -314,9 +344,8 @@ namespace retracesoftware {
 
         static void dealloc(BoundGate * self) {
             PyObject_GC_UnTrack(self);
-            Py_XDECREF(self->gate);
-            Py_XDECREF(self->target.callable);
-            Py_TYPE(self)->tp_free((PyObject *)self);
+            clear(self);
+            BoundGate_FreeList.release(self);
         }
 
         static int traverse(BoundGate * self, visitproc visit, void * arg) {
@@ -348,6 +377,8 @@ namespace retracesoftware {
     // __exit__:  restores previous executor.
     // ========================================================================
 
+    static FreeList<GateContext, 16> GateContext_FreeList;
+
     struct GateContext : public PyObject {
         Gate * gate;
         PyObject * new_executor;   // the executor to set on __enter__ (NULL = disable)
@@ -363,20 +394,21 @@ namespace retracesoftware {
             return Py_NewRef(self);
         }
 
-        static PyObject * exit(GateContext * self, PyObject * args) {
+        static PyObject * exit(GateContext * self, PyObject * const * args, Py_ssize_t nargs) {
             self->gate->set_executor(self->old_executor);
-            Py_XDECREF(self->old_executor);
-            self->old_executor = nullptr;
+            Py_CLEAR(self->old_executor);
 
+            if (nargs != 3) {
+                PyErr_Format(PyExc_TypeError, "__exit__ expected 3 arguments, got %zd", nargs);
+                return nullptr;
+            }
             Py_RETURN_FALSE;
         }
 
         static void dealloc(GateContext * self) {
             PyObject_GC_UnTrack(self);
-            Py_XDECREF(self->gate);
-            Py_XDECREF(self->new_executor);
-            Py_XDECREF(self->old_executor);
-            Py_TYPE(self)->tp_free((PyObject *)self);
+            clear(self);
+            GateContext_FreeList.release(self);
         }
 
         static int traverse(GateContext * self, visitproc visit, void * arg) {
@@ -429,8 +461,12 @@ namespace retracesoftware {
             PyObject * prev = gate->executor();
             Py_XINCREF(prev);
 
-            // Activate our executor
-            gate->set_executor(self->executor);
+            // Activate our executor, unless it is already the active one
+            // (e.g. nested apply_with of the same executor)
+            PyObject * desired = self->executor ? self->executor : gate->default_executor;
+            if (prev != desired) {
+                gate->set_executor(self->executor);
+            }
 
             // Call f(*args[1:], **kwargs)
             // args[0] = func, so args+1 starts at the real arguments.
@@ -439,8 +475,11 @@ namespace retracesoftware {
             PyObject * result = PyObject_Vectorcall(func, args + 1,
                 (nargs - 1) | PY_VECTORCALL_ARGUMENTS_OFFSET, kwnames);
 
-            // Restore previous executor (even on exception)
-            gate->set_executor(prev);
+            // Restore previous executor (even on exception), skipping the
+            // write if nothing changed it
+            if (gate->executor() != prev) {
+                gate->set_executor(prev);
+            }
             Py_XDECREF(prev);
 
             return result;
@@ -470,7 +509,8 @@ namespace retracesoftware {
             if (self->executor) {
                 return PyUnicode_FromFormat("<ApplyWith executor=%R>", self->executor);
             } else {
-                return PyUnicode_FromString("<ApplyWith disabled>");
+                static PyObject * disabled = nullptr;
+                return constant_repr(&disabled, "<ApplyWith disabled>");
             }
         }
 
@@ -523,7 +563,8 @@ namespace retracesoftware {
             if (self->executor) {
                 return PyUnicode_FromFormat("<GatePredicate executor=%R>", self->executor);
             } else {
-                return PyUnicode_FromString("<GatePredicate disabled>");
+                static PyObject * disabled = nullptr;
+                return constant_repr(&disabled, "<GatePredicate disabled>");
             }
         }
 
@@ -550,15 +591,16 @@ namespace retracesoftware {
     // --- Deferred implementations (need complete types) ---
 
     PyObject * Gate::call(Gate * self, PyObject ** args, size_t nargsf, PyObject * kwnames) {
-        PyObject * exec = self->executor();
-        if (exec == nullptr) {
+        GateCache & entry = self->current();
+        if (entry.executor.callable == nullptr) {
             Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
             if (nargs == 0) Py_RETURN_NONE;
             return PyObject_Vectorcall(args[0], args + 1,
                 (nargs - 1) | (nargsf & PY_VECTORCALL_ARGUMENTS_OFFSET),
                 kwnames);
         }
-        return PyObject_Vectorcall(exec, args, nargsf, kwnames);
+        // Call through the executor's vectorcall pointer cached on set()
+        return entry.executor(args, nargsf, kwnames);
     }
 
     PyObject * Gate::context(Gate * self, PyObject * executor) {
@@ -568,7 +610,7 @@ namespace retracesoftware {
             return nullptr;
         }
 
-        GateContext * ctx = (GateContext *)GateContext_Type.tp_alloc(&GateContext_Type, 0);
+        GateContext * ctx = GateContext_FreeList.alloc(&GateContext_Type);
         if (!ctx) return nullptr;
 
         ctx->gate = (Gate *)Py_NewRef(self);
@@ -607,7 +649,7 @@ namespace retracesoftware {
         .tp_repr = (reprfunc)Gate::repr,
         .tp_call = PyVectorcall_Call,
         .tp_str = (reprfunc)Gate::repr,
-        .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_VECTORCALL,
+        .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_VECTORCALL | Py_TPFLAGS_IMMUTABLETYPE,
         .tp_doc = "Gate — a thread-local function executor.\n\n"
                   "Create a Gate, bind functions to it, then set/disable the executor per thread.\n"
                   "When disabled (default), bound functions call through directly.\n"
@@ -622,7 +664,7 @@ namespace retracesoftware {
 
     static PyMethodDef GateContext_methods[] = {
         {"__enter__", (PyCFunction)GateContext::enter, METH_NOARGS, ""},
-        {"__exit__",  (PyCFunction)GateContext::exit,  METH_VARARGS, ""},
+        {"__exit__",  (PyCFunction)GateContext::exit,  METH_FASTCALL, ""},
         {NULL, NULL, 0, NULL}
     };
 
@@ -631,7 +673,10 @@ namespace retracesoftware {
         .tp_name = MODULE "GateContext",
         .tp_basicsize = sizeof(GateContext),
         .tp_dealloc = (destructor)GateContext::dealloc,
-        .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_DISALLOW_INSTANTIATION,
+        .tp_flags = Py_TPFLAGS_DEFAULT |
+                    Py_TPFLAGS_HAVE_GC |
+                    Py_TPFLAGS_DISALLOW_INSTANTIATION |
+                    Py_TPFLAGS_IMMUTABLETYPE,
         .tp_doc = "Context manager for temporarily setting a Gate executor.",
         .tp_traverse = (traverseproc)GateContext::traverse,
         .tp_clear = (inquiry)GateContext::clear,
@@ -657,7 +702,8 @@ namespace retracesoftware {
         .tp_flags = Py_TPFLAGS_DEFAULT |
                     Py_TPFLAGS_HAVE_GC |
                     Py_TPFLAGS_HAVE_VECTORCALL |
-                    Py_TPFLAGS_DISALLOW_INSTANTIATION,
+                    Py_TPFLAGS_DISALLOW_INSTANTIATION |
+                    Py_TPFLAGS_IMMUTABLETYPE,
         .tp_doc = "A callable bound to a Gate. Delegates to the gate's thread-local executor.",
         .tp_traverse = (traverseproc)BoundGate::traverse,
         .tp_clear = (inquiry)BoundGate::clear,
@@ -681,7 +727,8 @@ namespace retracesoftware {
         .tp_flags = Py_TPFLAGS_DEFAULT |
                     Py_TPFLAGS_HAVE_GC |
                     Py_TPFLAGS_HAVE_VECTORCALL |
-                    Py_TPFLAGS_DISALLOW_INSTANTIATION,
+                    Py_TPFLAGS_DISALLOW_INSTANTIATION |
+                    Py_TPFLAGS_IMMUTABLETYPE,
         .tp_doc = "Callable that temporarily sets a Gate executor, calls f(*args, **kwargs), then restores.",
         .tp_traverse = (traverseproc)ApplyWith::traverse,
         .tp_clear = (inquiry)ApplyWith::clear,
@@ -699,7 +746,8 @@ namespace retracesoftware {
         .tp_flags = Py_TPFLAGS_DEFAULT |
                     Py_TPFLAGS_HAVE_GC |
                     Py_TPFLAGS_HAVE_VECTORCALL |
-                    Py_TPFLAGS_DISALLOW_INSTANTIATION,
+                    Py_TPFLAGS_DISALLOW_INSTANTIATION |
+                    Py_TPFLAGS_IMMUTABLETYPE,
         .tp_doc = "Callable predicate: returns True if the gate's executor is a specific object (identity check).",
         .tp_traverse = (traverseproc)GatePredicate::traverse,
         .tp_clear = (inquiry)GatePredicate::clear,
@@ -720,7 +768,7 @@ namespace retracesoftware {
             return nullptr;
         }
 
-        BoundGate * bound = (BoundGate *)BoundGate_Type.tp_alloc(&BoundGate_Type, 0);
+        BoundGate * bound = BoundGate_FreeList.alloc(&BoundGate_Type);
         if (!bound) return nullptr;
 
         bound->gate = (Gate *)Py_NewRef(self);
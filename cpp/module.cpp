@@ -160,13 +160,13 @@ static PyObject* get_hashseed(PyObject* self, PyObject* args) {
 }
 
 static PyObject* try_unwrap(PyObject* self, PyObject* arg) {
-    return Py_NewRef(PyObject_TypeCheck(arg, &retracesoftware::Wrapped_Type)
+    return Py_NewRef(retracesoftware::Wrapped_Check(arg)
         ? retracesoftware::Wrapped_Target(arg)
         : arg);
 }
 
 static PyObject* unwrap(PyObject* self, PyObject* arg) {
-    if (!PyObject_TypeCheck(arg, &retracesoftware::Wrapped_Type)) {
+    if (!retracesoftware::Wrapped_Check(arg)) {
         PyErr_Format(PyExc_TypeError, "Cannot unwrap: %S as it is not wrapped", arg);
         return nullptr;
     }
@@ -182,7 +182,7 @@ static PyObject * unwrap_apply(PyObject *module, PyObject * const * args, size_t
 
     PyObject * wrapped = args[0];
 
-    if (!PyObject_TypeCheck(wrapped, &retracesoftware::Wrapped_Type)) {
+    if (!retracesoftware::Wrapped_Check(wrapped)) {
         PyErr_Format(PyExc_TypeError, "first argment: %S must be of type: %S", args[0], &retracesoftware::Wrapped_Type);
         return nullptr;
     }
@@ -351,7 +351,7 @@ static PyObject * patch_hash(PyObject * module, PyObject * args, PyObject * kwar
 }
 
 static PyObject * is_wrapped(PyObject * module, PyObject * obj) {
-    return PyBool_FromLong(PyObject_TypeCheck(obj, &retracesoftware::Wrapped_Type));
+    return PyBool_FromLong(retracesoftware::Wrapped_Check(obj));
 }
 
 static PyObject * is_method_descriptor(PyObject * module, PyObject * obj) {
@@ -679,6 +679,12 @@ PyMODINIT_FUNC CONCAT(PyInit_, MODULE_NAME)(void) {
         return NULL;
     }
 
+#ifdef Py_GIL_DISABLED
+    // The Gate executor cache and the type freelists are plain globals
+    // that rely on the GIL for exclusion; keep it enabled while loaded.
+    PyUnstable_Module_SetGIL(module, Py_MOD_GIL_USED);
+#endif
+
     retracesoftware::ModuleState* state = retracesoftware::get_module_state(module);
     if (state == NULL) {
         Py_DECREF(module);
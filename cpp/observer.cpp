@@ -9,9 +9,12 @@ namespace retracesoftware {
         vectorcallfunc func_vectorcall;
 
         PyObject * on_call;
+        vectorcallfunc on_call_vectorcall;
         PyObject * on_result;
         vectorcallfunc on_result_vectorcall;
         PyObject * on_error;
+        vectorcallfunc on_error_vectorcall;
+        PyObject * weakreflist;
         vectorcallfunc vectorcall;
     };
 
@@ -35,7 +38,7 @@ namespace retracesoftware {
         assert (!PyErr_Occurred());
 
         if (self->on_call) {
-            if (!call_void(PyObject_Vectorcall, self->on_call, args, nargsf, kwnames)) {
+            if (!call_void(self->on_call_vectorcall, self->on_call, args, nargsf, kwnames)) {
                 return nullptr;
             }
             assert (!PyErr_Occurred());
@@ -64,7 +67,7 @@ namespace retracesoftware {
 
             for (int i = 0; i < 3; i++) if (!exc[i]) exc[i] = Py_None;
 
-            if (!call_void(PyObject_Vectorcall, self->on_error, exc, 3, nullptr)) {
+            if (!call_void(self->on_error_vectorcall, self->on_error, exc, 3, nullptr)) {
                 for (int i = 0; i < 3; i++) if (exc[i] != Py_None) Py_DECREF(exc[i]);
                 return nullptr;
             }
@@ -77,6 +80,7 @@ namespace retracesoftware {
     }
 
     static int traverse(Observer* self, visitproc visit, void* arg) {
+        Py_VISIT(self->func);
         Py_VISIT(self->on_call);
         Py_VISIT(self->on_result);
         Py_VISIT(self->on_error);
@@ -85,6 +89,7 @@ namespace retracesoftware {
     }
 
     static int clear(Observer* self) {
+        Py_CLEAR(self->func);
         Py_CLEAR(self->on_call);
         Py_CLEAR(self->on_result);
         Py_CLEAR(self->on_error);
@@ -93,6 +98,9 @@ namespace retracesoftware {
 
     static void dealloc(Observer *self) {
         PyObject_GC_UnTrack(self);          // Untrack from the GC
+        if (self->weakreflist) {
+            PyObject_ClearWeakRefs(self);
+        }
         clear(self);
         Py_TYPE(self)->tp_free((PyObject *)self);  // Free the object
     }
@@ -128,13 +136,23 @@ namespace retracesoftware {
         
         self->func = Py_XNewRef(function);
         self->func_vectorcall = extract_vectorcall(function);
+        // Each hook's vectorcall is resolved once here so a call goes
+        // straight through the cached function pointers.
         self->on_call = Py_XNewRef(on_call);
+
+        if (self->on_call)
+            self->on_call_vectorcall = extract_vectorcall(on_call);
+
         self->on_result = Py_XNewRef(on_result);
 
         if (self->on_result)
             self->on_result_vectorcall = extract_vectorcall(on_result);
 
         self->on_error = Py_XNewRef(on_error);
+
+        if (self->on_error)
+            self->on_error_vectorcall = extract_vectorcall(on_error);
+
         self->vectorcall = (vectorcallfunc)call;
 
         return 0;
@@ -167,6 +185,7 @@ namespace retracesoftware {
         .tp_doc = "TODO",
         .tp_traverse = (traverseproc)traverse,
         .tp_clear = (inquiry)clear,
+        .tp_weaklistoffset = OFFSET_OF_MEMBER(Observer, weakreflist),
         // .tp_methods = methods,
         .tp_members = members,
         .tp_descr_get = tp_descr_get,
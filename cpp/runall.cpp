@@ -5,34 +5,63 @@ namespace retracesoftware {
 
     struct RunAll : public PyVarObject {
         vectorcallfunc vectorcall;
+        PyObject * weakreflist;
         FastCall functions[];
 
         static PyObject * call(RunAll * self, PyObject** args, size_t nargsf, PyObject* kwnames) {
         
-            for (int i = 0; i < self->ob_size; i++) {
+            // args and kwnames are forwarded untouched, offset flag included
+            Py_ssize_t n = Py_SIZE(self);
+
+            for (Py_ssize_t i = 0; i < n; i++) {
                 PyObject * result = self->functions[i](args, nargsf, kwnames);
-                Py_XDECREF(result);
                 if (!result) return nullptr;
+                Py_DECREF(result);
             }
             Py_RETURN_NONE;
         }
 
         static PyObject* create(PyTypeObject* type, PyObject* args, PyObject* kwargs) {
 
-            auto* self = reinterpret_cast<RunAll*>(type->tp_alloc(type, PyTuple_Size(args)));
+            Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+
+            // nested runalls are spliced in, so runall(runall(a, b), c)
+            // calls a, b and c directly
+            Py_ssize_t n = 0;
+            for (Py_ssize_t i = 0; i < nargs; i++) {
+                PyObject * arg = PyTuple_GET_ITEM(args, i);
+                n += Py_IS_TYPE(arg, &RunAll_Type) ? Py_SIZE(arg) : 1;
+            }
+
+            auto* self = reinterpret_cast<RunAll*>(type->tp_alloc(type, n));
             if (!self) return nullptr;
 
             self->vectorcall = (vectorcallfunc)call;
 
-            for (size_t i = 0; i < PyTuple_Size(args); i++) {
-                self->functions[i] = FastCall(PyTuple_GetItem(args, i));
-                Py_INCREF(self->functions[i].callable);
+            FastCall * next = self->functions;
+
+            for (Py_ssize_t i = 0; i < nargs; i++) {
+                PyObject * arg = PyTuple_GET_ITEM(args, i);
+
+                if (Py_IS_TYPE(arg, &RunAll_Type)) {
+                    RunAll * inner = reinterpret_cast<RunAll*>(arg);
+                    for (Py_ssize_t j = 0; j < Py_SIZE(inner); j++) {
+                        *next = inner->functions[j];
+                        Py_INCREF(next->callable);
+                        next++;
+                    }
+                } else {
+                    *next++ = FastCall(Py_NewRef(arg));
+                }
             }
             return (PyObject*)self;
         }
 
         static void dealloc(RunAll *self) {
             PyObject_GC_UnTrack(self);          // Untrack from the GC
+            if (self->weakreflist) {
+                PyObject_ClearWeakRefs((PyObject *)self);
+            }
             clear(self);
             Py_TYPE(self)->tp_free((PyObject *)self);  // Free the object
         }
@@ -104,6 +133,7 @@ namespace retracesoftware {
         .tp_doc = "TODO",
         .tp_traverse = (traverseproc)RunAll::traverse,
         .tp_clear = (inquiry)RunAll::clear,
+        .tp_weaklistoffset = OFFSET_OF_MEMBER(RunAll, weakreflist),
         .tp_new = RunAll::create,
     };
 }
\ No newline at end of file
@@ -1,5 +1,6 @@
 #include "utils.h"
 #include <structmember.h>
+#include <algorithm>
 
 namespace retracesoftware {
 
@@ -7,7 +8,7 @@ namespace retracesoftware {
         return obj == NULL || obj == Py_None ? Py_NewRef(self) : PyMethod_New(self, obj);
     }
 
-    static void ThreadState_SetIndex(PyObject * state, int index);
+    static int ThreadState_SetIndex(PyObject * state, int index);
     static int ThreadState_GetIndex(PyObject * state);
     static PyObject * ThreadState_AvaliableStates(PyObject * state);
     static PyObject * ThreadState_ValueForIndex(PyObject * state, int index);
@@ -18,9 +19,17 @@ namespace retracesoftware {
         int desired_index,
         bool sticky);
 
+    struct Dispatch;
+
+    // dispatch and method_dispatch share one list per state count, since
+    // the handler table is inline in the object
+    static const int Dispatch_MaxFreeStates = 8;
+    static FreeList<Dispatch, 64> Dispatch_FreeList[Dispatch_MaxFreeStates + 1];
+
     struct Dispatch : public PyVarObject {
         PyObject * state;
         vectorcallfunc vectorcall;
+        PyObject * cached_table;
         FastCall handlers[];
 
         // PyObject ** handlers() {
@@ -28,55 +37,95 @@ namespace retracesoftware {
         // }
 
         PyObject * handler() {
-            return (handlers + ThreadState_GetIndex(state))->callable;
+            int index = ThreadState_GetIndex(state);
+            return index >= 0 ? handlers[index].callable : nullptr;
         }
 
         static int setattro(Dispatch *self, PyObject *name, PyObject * value) {
             PyObject * handler = self->handler();
+            if (!handler && PyErr_Occurred()) return -1;
             return handler ? PyObject_SetAttr(handler, name, value) : 0;
         }
 
         static PyObject * getattro(Dispatch *self, PyObject *name) {
             PyObject * handler = self->handler();
+            if (!handler && PyErr_Occurred()) return nullptr;
             return handler ? PyObject_GetAttr(handler, name) : Py_NewRef(Py_None);
         }
 
+        // Vectorcall entry for both dispatch and method_dispatch. args, nargsf
+        // and kwnames are forwarded untouched (including
+        // PY_VECTORCALL_ARGUMENTS_OFFSET), so a bound method_dispatch call
+        // keeps CPython's in-place self prepend and no tuple/dict is built.
         static PyObject * call(Dispatch * self, PyObject** args, size_t nargsf, PyObject* kwnames) {
-        
-            FastCall * fc = self->handlers + ThreadState_GetIndex(self->state);
 
-            return fc->callable ? fc->operator()(args, nargsf, kwnames) : Py_NewRef(Py_None);
+            int index = ThreadState_GetIndex(self->state);
+            if (__builtin_expect(index < 0, 0)) return nullptr;
+
+            FastCall * fc = self->handlers + index;
+
+            return __builtin_expect(fc->callable != nullptr, 1)
+                ? fc->operator()(args, nargsf, kwnames)
+                : Py_NewRef(Py_None);
         }
 
         static void dealloc(Dispatch *self) {
             PyObject_GC_UnTrack(self);          // Untrack from the GC
             clear(self);
-            Py_TYPE(self)->tp_free((PyObject *)self);  // Free the object
+
+            Py_ssize_t size = Py_SIZE(self);
+
+            if (size <= Dispatch_MaxFreeStates) {
+                Dispatch_FreeList[size].release(self);
+            } else {
+                Py_TYPE(self)->tp_free((PyObject *)self);  // Free the object
+            }
+        }
+
+        static Dispatch * alloc(PyTypeObject * cls, Py_ssize_t size) {
+            assert(cls == &Dispatch_Type || cls == &MethodDispatch_Type);
+
+            if (size <= Dispatch_MaxFreeStates) {
+                Dispatch * self = Dispatch_FreeList[size].pop(cls);
+                if (self) {
+                    std::fill_n(self->handlers, size, FastCall());
+                    return self;
+                }
+            }
+            return (Dispatch *)cls->tp_alloc(cls, size);
         }
 
         static int clear(Dispatch* self) {
             Py_CLEAR(self->state);
+            Py_CLEAR(self->cached_table);
             for (int i = 0; i < self->ob_size; i++) {
                 Py_CLEAR(self->handlers[i].callable);
             }
             return 0;
         }
 
+        // The name -> handler dict is built once and kept until set_dispatch
+        // changes a handler; callers get a copy they are free to mutate.
         PyObject * table() {
-            PyObject * avaliable = ThreadState_AvaliableStates(state);
-
-            assert (PyTuple_Check(avaliable));
+            if (!cached_table) {
+                PyObject * avaliable = ThreadState_AvaliableStates(state);
 
-            Py_ssize_t n = PyTuple_Size(avaliable);
+                assert (PyTuple_Check(avaliable));
 
-            PyObject * res = PyDict_New();
+                Py_ssize_t n = PyTuple_GET_SIZE(avaliable);
 
-            for (Py_ssize_t i = 0; i < n; i++) {
-                PyObject * name = PyTuple_GetItem(avaliable, i);
+                PyObject * res = PyDict_New();
+                if (!res) return nullptr;
 
-                PyDict_SetItem(res, name, handlers[i].callable);
+                for (Py_ssize_t i = 0; i < n; i++) {
+                    if (PyDict_SetItem(res, PyTuple_GET_ITEM(avaliable, i), handlers[i].callable) < 0) {
+                        Py_DECREF(res);
+                        return nullptr;
+                    }
+                }
+                cached_table = res;
             }
-            return res;
+            return PyDict_Copy(cached_table);
         }
 
         static PyObject * dispatch_table(PyObject * cls, PyObject * obj) {
@@ -89,28 +138,33 @@ namespace retracesoftware {
         }
 
         static PyObject * repr(Dispatch *self) {
+            static PyObject * separator = nullptr;
+            if (!separator) {
+                separator = PyUnicode_InternFromString(",\n");
+                if (!separator) return nullptr;
+            }
 
             PyObject * avaliable = ThreadState_AvaliableStates(self->state);
 
             assert (PyTuple_Check(avaliable));
 
-            Py_ssize_t n = PyTuple_Size(avaliable);
+            Py_ssize_t n = PyTuple_GET_SIZE(avaliable);
 
-            PyObject * parts = PyList_New(n);
+            PyObject * parts = PyTuple_New(n);
 
             if (!parts) return nullptr;
 
             for (Py_ssize_t i = 0; i < n; i++) {
-                PyObject * repr = PyObject_Repr(self->handlers[i].callable);
+                PyObject * part = PyUnicode_FromFormat("%S = %R", PyTuple_GET_ITEM(avaliable, i), self->handlers[i].callable);
 
-                PyObject * part = PyUnicode_FromFormat("%S = %S", PyTuple_GetItem(avaliable, i), repr);
-
-                Py_DECREF(repr);
-
-                PyList_SET_ITEM(parts, i, part);  // steals reference
+                if (!part) {
+                    Py_DECREF(parts);
+                    return nullptr;
+                }
+                PyTuple_SET_ITEM(parts, i, part);  // steals reference
             }
 
-            PyObject *joined = PyUnicode_Join(PyUnicode_FromString(",\n"), parts);
+            PyObject *joined = PyUnicode_Join(separator, parts);
             
             Py_DECREF(parts);
             
@@ -128,6 +182,7 @@ namespace retracesoftware {
 
         static int traverse(Dispatch* self, visitproc visit, void* arg) {
             Py_VISIT(self->state);
+            Py_VISIT(self->cached_table);
             for (int i = 0; i < self->ob_size; i++) {
                 Py_VISIT(self->handlers[i].callable);
             }
@@ -158,7 +213,7 @@ namespace retracesoftware {
                     Py_TPFLAGS_HAVE_GC | 
                     Py_TPFLAGS_HAVE_VECTORCALL |
                     Py_TPFLAGS_DISALLOW_INSTANTIATION |
-                    Py_TPFLAGS_BASETYPE,
+                    Py_TPFLAGS_IMMUTABLETYPE,
         .tp_doc = "TODO",
         .tp_traverse = (traverseproc)Dispatch::traverse,
         .tp_clear = (inquiry)Dispatch::clear,
@@ -176,7 +231,8 @@ namespace retracesoftware {
                     Py_TPFLAGS_HAVE_GC | 
                     Py_TPFLAGS_HAVE_VECTORCALL |
                     Py_TPFLAGS_METHOD_DESCRIPTOR |
-                    Py_TPFLAGS_DISALLOW_INSTANTIATION,
+                    Py_TPFLAGS_DISALLOW_INSTANTIATION |
+                    Py_TPFLAGS_IMMUTABLETYPE,
         .tp_traverse = Dispatch_Type.tp_traverse,
         .tp_clear = Dispatch_Type.tp_clear,
         // .tp_methods = Dispatch_methods,
@@ -200,9 +256,9 @@ namespace retracesoftware {
         static int setattro(ThreadStateWrapped *self, PyObject *name, PyObject * value) {
             int previous = ThreadState_GetIndex(self->thread_state);
 
-            ThreadState_SetIndex(self->thread_state, self->desired_index);
+            if (previous < 0 || ThreadState_SetIndex(self->thread_state, self->desired_index) < 0) return -1;
             int result = PyObject_SetAttr(self->function, name, value);
-            ThreadState_SetIndex(self->thread_state, previous);
+            if (ThreadState_SetIndex(self->thread_state, previous) < 0) return -1;
 
             return result;
         }
@@ -234,9 +290,9 @@ namespace retracesoftware {
         static PyObject * getattro(ThreadStateWrapped *self, PyObject *name) {
             int previous = ThreadState_GetIndex(self->thread_state);
 
-            ThreadState_SetIndex(self->thread_state, self->desired_index);
+            if (previous < 0 || ThreadState_SetIndex(self->thread_state, self->desired_index) < 0) return nullptr;
             PyObject * result = PyObject_GetAttr(self->function, name);
-            ThreadState_SetIndex(self->thread_state, previous);
+            if (ThreadState_SetIndex(self->thread_state, previous) < 0) Py_CLEAR(result);
             return self->wrap_result(result);
         }
 
@@ -259,14 +315,16 @@ namespace retracesoftware {
             int previous = ThreadState_GetIndex(self->thread_state);
 
             PyObject * result;
-            if (previous == self->desired_index) {
+            if (previous < 0) {
+                result = nullptr;
+            } else if (previous == self->desired_index) {
                 result = PyObject_Vectorcall(self->function, args, nargsf, kwnames);
+            } else if (ThreadState_SetIndex(self->thread_state, self->desired_index) < 0) {
+                result = nullptr;
             } else {
-                ThreadState_SetIndex(self->thread_state, self->desired_index);
-
                 result = PyObject_Vectorcall(self->function, args, nargsf, kwnames);
                 
-                ThreadState_SetIndex(self->thread_state, previous);            
+                if (ThreadState_SetIndex(self->thread_state, previous) < 0) Py_CLEAR(result);
                 result = self->wrap_result(result);
             }
             Py_DECREF(self);
@@ -320,6 +378,10 @@ namespace retracesoftware {
         return self;
     }
 
+    struct ThreadStateContext;
+
+    static FreeList<ThreadStateContext, 16> ThreadStateContext_FreeList;
+
     struct ThreadStateContext : public PyObject {
         PyObject * thread_state;
         int desired_state;
@@ -328,10 +390,14 @@ namespace retracesoftware {
 
         static PyObject* enter(ThreadStateContext* self, PyObject* Py_UNUSED(args)) {
 
-            self->previous_state = ThreadState_GetIndex(self->thread_state);
-            if (self->previous_state != self->desired_state) {
-                ThreadState_SetIndex(self->thread_state, self->desired_state);
+            int previous = ThreadState_GetIndex(self->thread_state);
+            if (previous < 0) return nullptr;
+
+            if (previous != self->desired_state &&
+                ThreadState_SetIndex(self->thread_state, self->desired_state) < 0) {
+                return nullptr;
             }
+            self->previous_state = previous;
             return Py_NewRef(self);
         }
 
@@ -348,7 +414,7 @@ namespace retracesoftware {
         static void dealloc(ThreadStateContext *self) {
             PyObject_GC_UnTrack(self);          // Untrack from the GC
             clear(self);
-            Py_TYPE(self)->tp_free(self);
+            ThreadStateContext_FreeList.release(self);
         }
 
         static PyObject * repr(ThreadStateContext *self) {
@@ -363,15 +429,15 @@ namespace retracesoftware {
                 ThreadState_ValueForIndex(self->thread_state, self->desired_state));
         }
 
-        static PyObject *exit(ThreadStateContext* self, PyObject* args) {
+        static PyObject *exit(ThreadStateContext* self, PyObject * const * args, Py_ssize_t nargs) {
 
-            if (self->previous_state != self->desired_state)
-                ThreadState_SetIndex(self->thread_state, self->previous_state);
-
-            PyObject *exc_type, *exc_value, *traceback;
+            if (self->previous_state != self->desired_state &&
+                ThreadState_SetIndex(self->thread_state, self->previous_state) < 0) {
+                return NULL;
+            }
 
-            if (!PyArg_UnpackTuple(args, "__exit__", 3, 3,
-                                &exc_type, &exc_value, &traceback)) {
+            if (nargs != 3) {
+                PyErr_Format(PyExc_TypeError, "__exit__ expected 3 arguments, got %zd", nargs);
                 return NULL;
             }
             Py_RETURN_FALSE;  // Do not suppress exceptions
@@ -380,7 +446,7 @@ namespace retracesoftware {
 
     static PyMethodDef ThreadStateContext_methods[] = {
         {"__enter__", (PyCFunction)ThreadStateContext::enter, METH_NOARGS, ""},
-        {"__exit__",  (PyCFunction)ThreadStateContext::exit,  METH_VARARGS, ""},
+        {"__exit__",  (PyCFunction)ThreadStateContext::exit,  METH_FASTCALL, ""},
         {NULL, NULL, 0, NULL}
     };
 
@@ -398,10 +464,12 @@ namespace retracesoftware {
     };
 
     static PyObject * ThreadStateContext_New(PyObject * thread_state, int desired_state) {
-        ThreadStateContext *self = (ThreadStateContext *)ThreadStateContext_Type.tp_alloc(&ThreadStateContext_Type, 0);
+        ThreadStateContext * self = ThreadStateContext_FreeList.alloc(&ThreadStateContext_Type);
+        if (!self) return nullptr;
 
         self->thread_state = Py_NewRef(thread_state);
         self->desired_state = desired_state;
+        self->previous_state = desired_state;
         return self;
     }
 
@@ -427,7 +495,8 @@ namespace retracesoftware {
         }
 
         static PyObject * call(ThreadStatePredicate * self, PyObject** args, size_t nargsf, PyObject* kwnames) {
-            return PyBool_FromLong(ThreadState_GetIndex(self->thread_state) == self->test_index);
+            int index = ThreadState_GetIndex(self->thread_state);
+            return index >= 0 ? PyBool_FromLong(index == self->test_index) : nullptr;
         }
     };
 
@@ -453,62 +522,91 @@ namespace retracesoftware {
         return self;
     }
 
-    struct ThreadState;
-
-    static thread_local ThreadState * last_thread_state = nullptr;
-    static thread_local int last_per_thread_state = -1;
-
-    // const char * cached_thread_state() {
-    //     if (last_per_thread_state) {
-    //         PyObject * pystr = PyObject_Str(last_per_thread_state);
-    //         const char * str = PyUnicode_AsUTF8(pystr);
-    //         Py_DECREF(pystr);
-    //         return str;
-    //     } else {
-    //         return nullptr;
-    //     }
-    // }
-
+    // The per-thread state is kept in the PyThreadState dict, keyed by the
+    // ThreadState, so it follows the Python thread state (and interpreter)
+    // rather than the OS thread. A thread that has never set a value is in
+    // the default (first) state. Every write goes through to the dict, and
+    // the index last read or written is cached on the object against the
+    // PyThreadState and its unique id, so repeated use from one thread skips
+    // the dict lookup.
     struct ThreadState : public PyObject {
         PyObject * avaliable_states;
         PyObject * default_state;
         PyObject * predicates;
+        PyThreadState * cached_tstate;
+        uint64_t cached_tstate_id;
+        int cached_index;
 
-        // PyThreadState_GetDict()
+        // String states are interned in init, so literal names and keyword
+        // argument names match on the pointer scan without hashing or
+        // comparing. Anything else falls back to ==. Returns -1 without an
+        // exception set if the state is not found.
+        int find(PyObject * state) {
+            Py_ssize_t n = PyTuple_GET_SIZE(avaliable_states);
 
-        int index_of(PyObject * state) {
-            for (int i = 0; i < PyTuple_GET_SIZE(avaliable_states); i++) {
-                PyObject * item = PyTuple_GET_ITEM(avaliable_states, i);
+            for (Py_ssize_t i = 0; i < n; i++) {
+                if (PyTuple_GET_ITEM(avaliable_states, i) == state) return (int)i;
+            }
 
-                int eq = PyObject_RichCompareBool(state, item, Py_EQ);
+            for (Py_ssize_t i = 0; i < n; i++) {
+                int eq = PyObject_RichCompareBool(state, PyTuple_GET_ITEM(avaliable_states, i), Py_EQ);
 
-                if (eq < 0) return -1;
-                else if (eq > 0) return i;
+                if (eq < 0) return -2;
+                else if (eq > 0) return (int)i;
             }
-            PyErr_Format(PyExc_TypeError, "value: %S was not one of: %S", state, avaliable_states);
             return -1;
         }
 
+        int index_of(PyObject * state) {
+            int index = find(state);
+
+            if (index == -1) {
+                PyErr_Format(PyExc_TypeError, "value: %S was not one of: %S", state, avaliable_states);
+            }
+            return index < 0 ? -1 : index;
+        }
+
+        void cache(PyThreadState * tstate, int index) {
+            cached_tstate = tstate;
+            cached_tstate_id = PyThreadState_GetID(tstate);
+            cached_index = index;
+        }
+
+        static PyObject * thread_dict() {
+            PyObject * dict = PyThreadState_GetDict();
+            if (!dict && !PyErr_Occurred()) {
+                PyErr_SetString(PyExc_RuntimeError, "ThreadState used without a thread state dict");
+            }
+            return dict;
+        }
+
         int index() {
-            if (last_thread_state == this) {
-                return last_per_thread_state;
-            } else {
+            PyThreadState * tstate = PyThreadState_Get();
 
-                PyObject * dict = PyThreadState_GetDict();
-                PyObject * per_thread = PyDict_GetItem(dict, this);
+            if (__builtin_expect(tstate == cached_tstate, 1) &&
+                PyThreadState_GetID(tstate) == cached_tstate_id) {
+                return cached_index;
+            }
 
-                if (per_thread == nullptr) {
-                    PyDict_SetItem(dict, this, default_state);
-                    per_thread = Py_NewRef(default_state);
-                }
-                
-                int index = index_of(per_thread);
-                if (index >= 0) {
-                    last_thread_state = this;
-                    last_per_thread_state = index;
-                }
-                return index;
+            PyObject * dict = thread_dict();
+            if (!dict) return -1;
+
+            PyObject * state = PyDict_GetItemWithError(dict, this);
+            int i = 0;
+
+            if (state) {
+                Py_INCREF(state);
+                i = find(state);
+                Py_DECREF(state);
+
+                // only ever stored from avaliable_states
+                assert(i != -1);
+                if (i < 0) return -1;
+            } else if (PyErr_Occurred()) {
+                return -1;
             }
+            cache(tstate, i);
+            return i;
         }
 
         PyObject * per_thread_state() {
@@ -516,32 +614,16 @@ namespace retracesoftware {
             return i >= 0 ? PyTuple_GET_ITEM(avaliable_states, i) : nullptr;
         }
 
-        void set_state_by_index(int i) {
-            assert(i >= 0);
-
-            ThreadState* cached = last_thread_state;  // single TLS read
-            if (cached && cached != this) {
-                PyObject * dict = PyThreadState_GetDict();
-
-                PyObject * state = PyTuple_GET_ITEM(avaliable_states, last_per_thread_state);
-                PyDict_SetItem(dict, cached, state);
-                last_thread_state = this;
-            }
-            last_per_thread_state = i;
-        }
+        int set_state_by_index(int i) {
+            assert(i >= 0 && i < PyTuple_GET_SIZE(avaliable_states));
 
-        int get_state_index() {
-            ThreadState* cached = last_thread_state;  // single TLS read
-            if (cached != this) {
-                PyObject * dict = PyThreadState_GetDict();
+            PyObject * dict = thread_dict();
 
-                PyObject * state = PyTuple_GET_ITEM(avaliable_states, last_per_thread_state);
-                PyDict_SetItem(dict, cached, state);
-                
-                last_thread_state = this;
-                last_per_thread_state = index_of(PyDict_GetItem(dict, this));
+            if (!dict || PyDict_SetItem(dict, this, PyTuple_GET_ITEM(avaliable_states, i)) < 0) {
+                return -1;
             }
-            return last_per_thread_state;
+            cache(PyThreadState_Get(), i);
+            return 0;
         }
 
         static int init(ThreadState * self, PyObject * args, PyObject * kwds) {
@@ -555,8 +637,26 @@ namespace retracesoftware {
                 return -1;
             }
 
-            // self->avaliable_states = copy_tuple(args);
-            self->avaliable_states = Py_NewRef(args);
+            // Dispatches, predicates and contexts hold indices into the
+            // states, so they cannot be swapped out from under them
+            if (self->avaliable_states) {
+                PyErr_Format(PyExc_TypeError, "%S is already initialized", Py_TYPE(self));
+                return -1;
+            }
+
+            Py_ssize_t n = PyTuple_GET_SIZE(args);
+
+            PyObject * states = PyTuple_New(n);
+            if (!states) return -1;
+
+            for (Py_ssize_t i = 0; i < n; i++) {
+                PyObject * state = Py_NewRef(PyTuple_GET_ITEM(args, i));
+                if (PyUnicode_CheckExact(state)) {
+                    PyUnicode_InternInPlace(&state);
+                }
+                PyTuple_SET_ITEM(states, i, state);
+            }
+            self->avaliable_states = states;
 
             // TODO - check all elements are distinct
             
@@ -599,11 +699,13 @@ namespace retracesoftware {
         }
 
         static PyObject * repr(ThreadState *self) {
-            return PyUnicode_FromFormat("<ThreadState %S of %S>", self->per_thread_state(), self->avaliable_states);
+            PyObject * state = self->per_thread_state();
+            return state ? PyUnicode_FromFormat("<ThreadState %S of %S>", state, self->avaliable_states) : nullptr;
         }
 
         static PyObject * str(ThreadState *self) {
-            return PyUnicode_FromFormat("<ThreadState %S of %S>", self->per_thread_state(), self->avaliable_states);
+            PyObject * state = self->per_thread_state();
+            return state ? PyUnicode_FromFormat("<ThreadState %S of %S>", state, self->avaliable_states) : nullptr;
         }
 
         // static PyObject * iter(ThreadLocalProxy *self) {
@@ -646,44 +748,71 @@ namespace retracesoftware {
 
             Dispatch * dispatch = reinterpret_cast<Dispatch *>(PyTuple_GET_ITEM(args, 0));
 
-            for (int i = 0; i < PyTuple_GET_SIZE(self->avaliable_states); i++) {
-                PyObject * key = PyTuple_GET_ITEM(self->avaliable_states, i);
+            if (dispatch->state != self) {
+                PyErr_Format(PyExc_TypeError, "dispatch %S was not created by %S", dispatch, self);
+                return nullptr;
+            }
+
+            Py_CLEAR(dispatch->cached_table);
+
+            // Each override replaces exactly one slot of the flat handler table
+            Py_ssize_t pos = 0;
+            PyObject * key;
+            PyObject * val;
+
+            while (PyDict_Next(kwds, &pos, &key, &val)) {
+                int i = self->find(key);
 
-                if (PyDict_Contains(kwds, key)) {
-                    Py_DECREF(dispatch->handlers[i].callable);
-                    dispatch->handlers[i] = FastCall(Py_NewRef(PyDict_GetItem(kwds, key)));
+                if (i == -2) return nullptr;
+                else if (i >= 0) {
+                    PyObject * old = dispatch->handlers[i].callable;
+                    dispatch->handlers[i] = FastCall(Py_NewRef(val));
+                    Py_XDECREF(old);
                 }
             }
             Py_RETURN_NONE;
         }
         
+        // Builds the complete handler table up front: one slot per state, with
+        // states not named in kwds pointing at the default. Calls then index
+        // the table directly without any fallback logic.
         PyObject * create_dispatch(PyTypeObject * cls, PyObject * default_dispatch, PyObject *kwds) {
-            Dispatch * dispatch = (Dispatch *)cls->tp_alloc(cls, PyTuple_Size(avaliable_states));
+            Dispatch * dispatch = Dispatch::alloc(cls, PyTuple_GET_SIZE(avaliable_states));
 
             if (!dispatch) return nullptr;
 
             dispatch->vectorcall = (vectorcallfunc)Dispatch::call;
             dispatch->state = Py_NewRef(this);
+            dispatch->cached_table = nullptr;
 
-            for (int i = 0; i < PyTuple_GET_SIZE(avaliable_states); i++) {
-                PyObject * key = PyTuple_GET_ITEM(avaliable_states, i);
+            if (kwds) {
+                Py_ssize_t pos = 0;
+                PyObject * key;
+                PyObject * val;
 
-                PyObject * val = kwds ? PyDict_GetItem(kwds, key) : nullptr;
+                while (PyDict_Next(kwds, &pos, &key, &val)) {
+                    int i = find(key);
 
-                if (val) {
-                    dispatch->handlers[i] = FastCall(Py_XNewRef(val));
-                } else {
-                    if (PyErr_Occurred()) {
+                    if (i == -2) {
                         Py_DECREF(dispatch);
                         return nullptr;
-                    } else if (default_dispatch) {
-                        dispatch->handlers[i] = FastCall(Py_XNewRef(default_dispatch));
-                    } else {
-                        PyErr_Format(PyExc_TypeError, "unhandled case: %S, an no default dispatch given", key);
-                        return nullptr;
+                    } else if (i >= 0 && !dispatch->handlers[i].callable) {
+                        dispatch->handlers[i] = FastCall(Py_NewRef(val));
                     }
                 }
             }
+
+            for (int i = 0; i < PyTuple_GET_SIZE(avaliable_states); i++) {
+                if (dispatch->handlers[i].callable) continue;
+
+                if (!default_dispatch) {
+                    PyErr_Format(PyExc_TypeError, "unhandled case: %S, an no default dispatch given",
+                                 PyTuple_GET_ITEM(avaliable_states, i));
+                    Py_DECREF(dispatch);
+                    return nullptr;
+                }
+                dispatch->handlers[i] = FastCall(Py_NewRef(default_dispatch));
+            }
             return (PyObject *)dispatch;
         }
 
@@ -755,7 +884,7 @@ namespace retracesoftware {
         }
 
         static PyObject * value_getter(ThreadState *self, void *closure) {
-            return Py_NewRef(self->per_thread_state());
+            return Py_XNewRef(self->per_thread_state());
         }
 
         PyObject * state_for(int index) {
@@ -763,12 +892,20 @@ namespace retracesoftware {
         }
 
         static int value_setter(ThreadState *self, PyObject * value, void *closure) {
+            if (!value) {
+                PyErr_SetString(PyExc_AttributeError, "cannot delete ThreadState value");
+                return -1;
+            }
+            // Re-setting the current (interned) state is a no-op
+            PyObject * current = self->per_thread_state();
+            if (!current) return -1;
+            if (current == value) return 0;
+
             int index = self->index_of(value);
 
             if (index < 0) return -1;
 
-            ThreadState_SetIndex(self, index);
-            return 0;
+            return ThreadState_SetIndex(self, index);
         }
     };
 
@@ -795,25 +932,25 @@ namespace retracesoftware {
     // }
 
     static PyObject * ThreadState_AvaliableStates(PyObject * state) {
-        assert(Py_TYPE(state) == &ThreadState_Type);
+        assert(PyObject_TypeCheck(state, &ThreadState_Type));
 
         return reinterpret_cast<ThreadState *>(state)->avaliable_states;
     }
 
     static PyObject * ThreadState_ValueForIndex(PyObject * state, int index) {
-        assert(Py_TYPE(state) == &ThreadState_Type);
+        assert(PyObject_TypeCheck(state, &ThreadState_Type));
 
         return reinterpret_cast<ThreadState *>(state)->state_for(index);
     }
 
-    static void ThreadState_SetIndex(PyObject * state, int index) {
-        assert(Py_TYPE(state) == &ThreadState_Type);
+    static int ThreadState_SetIndex(PyObject * state, int index) {
+        assert(PyObject_TypeCheck(state, &ThreadState_Type));
 
         return reinterpret_cast<ThreadState *>(state)->set_state_by_index(index);
     }
 
     static int ThreadState_GetIndex(PyObject * state) {
-        assert(Py_TYPE(state) == &ThreadState_Type);
+        assert(PyObject_TypeCheck(state, &ThreadState_Type));
 
         return reinterpret_cast<ThreadState *>(state)->index();
     }
@@ -109,8 +109,6 @@ namespace retracesoftware {
 
     ModuleState* get_module_state(PyObject* module);
 
-    PyObject * Wrapped_Target(PyObject * proxy);
-
     void * Reference_GetPointer(PyObject * reference);
 
     // PyObject * create_proxy(PyTypeObject * proxytype, PyObject * handler, PyObject * target);
@@ -179,12 +177,68 @@ namespace retracesoftware {
     bool FrameEval_Install(PyInterpreterState * is, PyObject * handler);
 
     bool install_new_wrapper(PyTypeObject * cls, PyObject * handler);
-    
+
+    // Pool of up to N freed instances of a static type, handed back out in
+    // place of the allocator. Guarded by the GIL.
+    //
+    // release() is called at the end of tp_dealloc, after the object has
+    // been untracked and cleared, so every object slot is NULL while it sits
+    // on the list. That makes it safe for pop()/alloc() to reset the type and
+    // refcount and re-track GC types straight away; the caller then fills in
+    // the remaining fields exactly as it would for a fresh tp_alloc result.
+    template <typename T, int N>
+    class FreeList {
+        T * items[N];
+        int count = 0;
+
+    public:
+        // A recycled instance as a new reference, or nullptr if empty
+        T * pop(PyTypeObject * type) {
+            if (count == 0) return nullptr;
+
+            assert(!(type->tp_flags & Py_TPFLAGS_HEAPTYPE));
+
+            PyObject * obj = reinterpret_cast<PyObject *>(items[--count]);
+            Py_SET_TYPE(obj, type);
+            _Py_NewReference(obj);
+            if (PyType_IS_GC(type)) PyObject_GC_Track(obj);
+            return reinterpret_cast<T *>(obj);
+        }
+
+        T * alloc(PyTypeObject * type, Py_ssize_t nitems = 0) {
+            T * obj = pop(type);
+            return obj ? obj : reinterpret_cast<T *>(type->tp_alloc(type, nitems));
+        }
+
+        void release(T * obj) {
+            if (count < N) {
+                items[count++] = obj;
+            } else {
+                Py_TYPE(obj)->tp_free((PyObject *)obj);
+            }
+        }
+    };
+
     struct Wrapped : public PyObject {
         PyObject * target;
         PyObject * weakreflist;
     };
 
+    // wrapped_function and wrapped_member are leaf types, so an exact type
+    // compare settles the common case before falling back to the subtype walk
+    // needed for Proxy and Python-level subclasses of Wrapped.
+    static inline bool Wrapped_Check(PyObject * obj) {
+        PyTypeObject * type = Py_TYPE(obj);
+        return type == &WrappedFunction_Type ||
+               type == &WrappedMember_Type ||
+               PyType_IsSubtype(type, &Wrapped_Type);
+    }
+
+    static inline PyObject * Wrapped_Target(PyObject * wrapped) {
+        assert(Wrapped_Check(wrapped));
+        return reinterpret_cast<Wrapped *>(wrapped)->target;
+    }
+
     bool set_on_alloc(PyTypeObject *type, PyObject * callback);
 
     bool intercept_dict_set(PyObject * dict, PyObject * on_set);
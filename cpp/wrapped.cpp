@@ -73,15 +73,6 @@ namespace retracesoftware {
         .tp_new = (newfunc)create,
     };
 
-    bool Wrapped_Check(PyObject * obj) {
-        return PyObject_TypeCheck(obj, &Wrapped_Type);
-    }
-
-    PyObject * Wrapped_Target(PyObject * proxy) {
-        assert(Wrapped_Check(proxy));
-        return reinterpret_cast<Wrapped *>(proxy)->target;
-    }
-
     PyObject * create_wrapped(PyTypeObject * cls, PyObject * target) {
         
         if (!PyType_IsSubtype(cls, &Wrapped_Type)) {
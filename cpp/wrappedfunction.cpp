@@ -10,6 +10,10 @@
 
 namespace retracesoftware {
 
+    struct WrappedFunction;
+
+    static FreeList<WrappedFunction, 64> WrappedFunction_FreeList;
+
     struct WrappedFunction : public Wrapped {
         PyObject * handler;
         vectorcallfunc handler_vectorcall;
@@ -25,13 +29,24 @@ namespace retracesoftware {
             return Wrapped_Type.tp_clear(self);
         }
 
+        static void dealloc(WrappedFunction * self) {
+            PyObject_GC_UnTrack(self);
+            if (self->weakreflist) {
+                PyObject_ClearWeakRefs(self);
+            }
+            clear(self);
+            WrappedFunction_FreeList.release(self);
+        }
+
+        // Callers that did not reserve args[-1] get a copy of the whole stack,
+        // keyword values included, with target prepended.
         PyObject * call_with_alloca(PyObject* const * args, size_t nargs, PyObject* kwnames) {
-            size_t total_args = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) + 1;
+            size_t nstack = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0);
 
-            PyObject ** mem = (PyObject **)alloca(sizeof(PyObject *) * (total_args + 1)) + 1;
+            PyObject ** mem = (PyObject **)alloca(sizeof(PyObject *) * (nstack + 2)) + 1;
 
             mem[0] = target;
-            for (size_t i = 0; i < nargs; i++) {
+            for (size_t i = 0; i < nstack; i++) {
                 mem[i + 1] = args[i];
             }
             size_t nargsf = (nargs + 1) | PY_VECTORCALL_ARGUMENTS_OFFSET;
@@ -68,7 +83,9 @@ namespace retracesoftware {
                 return nullptr;
             }
 
-            WrappedFunction * self = (WrappedFunction *)cls->tp_alloc(cls, 0);
+            WrappedFunction * self = cls == &WrappedFunction_Type
+                ? WrappedFunction_FreeList.alloc(cls)
+                : (WrappedFunction *)cls->tp_alloc(cls, 0);
 
             if (!self) return nullptr;
 
@@ -117,7 +134,7 @@ namespace retracesoftware {
         .tp_name = MODULE "wrapped_function",
         .tp_basicsize = sizeof(WrappedFunction),
         .tp_itemsize = 0,
-        // .tp_dealloc = (destructor)MethodDescriptor_dealloc,
+        .tp_dealloc = (destructor)WrappedFunction::dealloc,
         .tp_vectorcall_offset = OFFSET_OF_MEMBER(WrappedFunction, vectorcall),
         .tp_repr = (reprfunc)WrappedFunction::repr,
         .tp_call = PyVectorcall_Call,
@@ -127,7 +144,8 @@ namespace retracesoftware {
         .tp_flags = Py_TPFLAGS_DEFAULT |
                     Py_TPFLAGS_HAVE_GC |
                     Py_TPFLAGS_HAVE_VECTORCALL |
-                    Py_TPFLAGS_METHOD_DESCRIPTOR,
+                    Py_TPFLAGS_METHOD_DESCRIPTOR |
+                    Py_TPFLAGS_IMMUTABLETYPE,
         .tp_doc = "TODO",
         .tp_traverse = (traverseproc)WrappedFunction::traverse,
         .tp_clear = (inquiry)WrappedFunction::clear,
@@ -3,6 +3,10 @@
 
 namespace retracesoftware {
 
+    struct WrappedMember;
+
+    static FreeList<WrappedMember, 64> WrappedMember_FreeList;
+
     struct WrappedMember : public Wrapped {
         PyObject * handler;
 
@@ -18,6 +22,20 @@ namespace retracesoftware {
             return 0;
         }
 
+        static void dealloc(WrappedMember * self) {
+            PyObject_GC_UnTrack(self);
+            if (self->weakreflist) {
+                PyObject_ClearWeakRefs(self);
+            }
+            clear(self);
+            WrappedMember_FreeList.release(self);
+        }
+
+        static PyObject * create(PyTypeObject * cls, PyObject * args, PyObject * kwargs) {
+            WrappedMember * self = cls == &WrappedMember_Type ? WrappedMember_FreeList.pop(cls) : nullptr;
+            return self ? self : PyType_GenericNew(cls, args, kwargs);
+        }
+
         static int init(WrappedMember * self, PyObject * args, PyObject * kwargs) {
 
             PyObject * handler;
@@ -88,12 +106,12 @@ namespace retracesoftware {
         .tp_name = MODULE "wrapped_member",
         .tp_basicsize = sizeof(WrappedMember),
         .tp_itemsize = 0,
-        // .tp_dealloc = (destructor)MethodDescriptor_dealloc,
+        .tp_dealloc = (destructor)WrappedMember::dealloc,
         .tp_repr = (reprfunc)WrappedMember::repr,
         // .tp_getattro = (binaryfunc)MethodDescriptor_getattro,
         .tp_str = (reprfunc)WrappedMember::repr,
 
-        .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
+        .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_IMMUTABLETYPE,
         .tp_doc = "TODO",
         .tp_traverse = (traverseproc)WrappedMember::traverse,
         .tp_clear = (inquiry)WrappedMember::clear,
@@ -102,7 +120,7 @@ namespace retracesoftware {
         .tp_descr_get = (descrgetfunc)WrappedMember::tp_descr_get,
         .tp_descr_set = (descrsetfunc)WrappedMember::tp_descr_set,
         .tp_init = (initproc)WrappedMember::init,
-        .tp_new = PyType_GenericNew,
+        .tp_new = (newfunc)WrappedMember::create,
     };
 
 }
\ No newline at end of file
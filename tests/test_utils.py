@@ -36,12 +36,35 @@ except ModuleNotFoundError:  # Fallback for running directly from the repo
 #     ]
 
 
-def test_counter_is_callable_and_increments():
-    counter = _utils.counter(initial=5)
+@pytest.mark.parametrize("initial, expected", [(5, [5, 6]), (0, [0, 1])])
+def test_counter_is_callable_and_increments(initial, expected):
+    counter = _utils.counter(initial=initial)
 
-    assert counter() == 5
-    assert counter() == 6
-    assert counter.value == 7
+    assert [counter(), counter()] == expected
+    assert counter.value == expected[-1] + 1
+
+
+def test_counter_converts_to_int_without_advancing():
+    import operator
+
+    counter = _utils.counter(initial=3)
+    assert operator.index(counter) == 3
+    assert int(counter) == 3
+    assert [10, 11, 12, 13, 14][counter] == 13
+    assert counter() == 3
+
+
+def test_recycled_counters_start_from_their_initial_value():
+    for i in range(200):
+        counter = _utils.counter(initial=i)
+        assert counter() == i
+        assert _utils.counter().value == 0
+
+    used = _utils.counter(initial=42)
+    del used
+    fresh = _utils.counter.__new__(_utils.counter)
+    assert fresh.value == 0
+    assert fresh() == 0
 
 
 def test_runall_invokes_all_functions_in_order():
@@ -63,6 +86,32 @@ def test_runall_invokes_all_functions_in_order():
     ]
 
 
+def test_nested_runall_calls_every_function_in_order():
+    calls = []
+
+    def make(name):
+        return lambda *args: calls.append((name, args))
+
+    inner = _utils.runall(make("a"), make("b"))
+    runner = _utils.runall(inner, make("c"), _utils.runall(make("d")))
+    del inner
+
+    assert runner(1) is None
+    assert calls == [("a", (1,)), ("b", (1,)), ("c", (1,)), ("d", (1,))]
+
+
+def test_runall_stops_at_first_error():
+    calls = []
+
+    def bad(*args):
+        raise ValueError("bad")
+
+    runner = _utils.runall(calls.append, bad, calls.append)
+    with pytest.raises(ValueError):
+        runner(1)
+    assert calls == [1]
+
+
 # def test_striptraceback_removes_traceback_and_context():
 #     def boom():
 #         raise ValueError("boom")
@@ -119,6 +168,89 @@ def test_observer_hooks_and_error_handling():
     assert exc_tb is None or hasattr(exc_tb, "tb_frame")
 
 
+def test_observer_releases_wrapped_function():
+    import gc
+    import weakref
+
+    def base(x):
+        return x
+
+    ref = weakref.ref(base)
+    observer = _utils.observer(base, on_call=lambda *a, **k: None)
+    assert observer(1) == 1
+
+    del base, observer
+    gc.collect()
+    assert ref() is None
+
+
+def test_callable_wrappers_are_weak_referenceable():
+    import gc
+    import weakref
+
+    for make in (
+        lambda: _utils.counter(),
+        lambda: _utils.runall(len),
+        lambda: _utils.observer(len, on_call=lambda *a, **k: None),
+    ):
+        obj = make()
+        ref = weakref.ref(obj)
+        assert ref() is obj
+        del obj
+        gc.collect()
+        assert ref() is None
+
+
+def test_intercept_dict_set_transforms_and_restores_type():
+    data = {}
+    _utils.intercept_dict_set(data, lambda key, value: (key, value))
+    assert type(data) is not dict
+
+    value = object()
+    before = sys.getrefcount(value)
+    for _ in range(10):
+        data["a"] = value
+    data.update(b=2)
+
+    assert data == {"a": ("a", value), "b": ("b", 2)}
+    assert sys.getrefcount(value) == before + 1
+
+    data.update({"c": 3}, d=4)
+    data.update([("e", 5)])
+    assert data["c"] == ("c", 3)
+    assert data["d"] == ("d", 4)
+    assert data["e"] == ("e", 5)
+
+    _utils.intercept_dict_set(data, None)
+    assert type(data) is dict
+    data["c"] = 3
+    assert data["c"] == 3
+
+
+def test_intercept_dict_update_propagates_errors_from_keys():
+    class BrokenMapping:
+        def keys(self):
+            raise AttributeError("broken keys")
+
+        def __iter__(self):
+            return iter([("a", 1)])
+
+    data = {}
+    _utils.intercept_dict_set(data, lambda key, value: value)
+    with pytest.raises(AttributeError, match="broken keys"):
+        data.update(BrokenMapping())
+    assert data == {}
+    _utils.intercept_dict_set(data, None)
+
+
+def test_intercept_dict_set_rejects_dict_subclasses():
+    class Sub(dict):
+        pass
+
+    with pytest.raises(TypeError, match="Sub"):
+        _utils.intercept_dict_set(Sub(), lambda key, value: value)
+
+
 def test_stack_functions_returns_list_of_functions():
     """Test that stack_functions() returns a valid list without crashing.
     
@@ -965,6 +1097,94 @@ class TestThreadState:
         with pytest.raises(TypeError):
             state.value = 'nonexistent'
 
+    def test_value_is_per_thread(self):
+        import threading
+
+        state = _utils.ThreadState('disabled', 'internal', 'external')
+        other = _utils.ThreadState('disabled', 'internal')
+        state.value = 'internal'
+        other.value = 'internal'
+
+        seen = []
+
+        def worker():
+            seen.append(state.value)
+            state.value = 'external'
+            seen.append(state.value)
+            seen.append(other.value)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+
+        assert seen == ['disabled', 'external', 'disabled']
+        assert state.value == 'internal'
+        assert other.value == 'internal'
+        state.value = 'disabled'
+        other.value = 'disabled'
+
+    def test_new_thread_starts_in_default_state(self):
+        import threading
+
+        state = _utils.ThreadState('a', 'b')
+        seen = []
+
+        def worker():
+            seen.append(state.value)
+            state.value = 'b'
+
+        # successive threads may reuse the same PyThreadState allocation
+        for _ in range(5):
+            t = threading.Thread(target=worker)
+            t.start()
+            t.join()
+
+        assert seen == ['a'] * 5
+        assert state.value == 'a'
+
+    def test_reinit_is_rejected(self):
+        state = _utils.ThreadState('a', 'b')
+        dispatch = state.dispatch(lambda: 'a', b=lambda: 'b')
+        state.value = 'b'
+
+        with pytest.raises(TypeError):
+            state.__init__('a', 'b', 'c')
+
+        assert state.value == 'b'
+        assert dispatch() == 'b'
+
+    def test_many_live_instances(self):
+        states = [_utils.ThreadState('a', 'b') for _ in range(5000)]
+        states[-1].value = 'b'
+        assert states[-1].value == 'b'
+        assert states[0].value == 'a'
+
+    def test_storage_errors_propagate(self):
+        class Unhashable(_utils.ThreadState):
+            def __hash__(self):
+                raise ValueError("no hash")
+
+        state = Unhashable('a', 'b')
+        with pytest.raises(ValueError):
+            state.value = 'b'
+        with pytest.raises(ValueError):
+            with state.select('b'):
+                pass
+
+    def test_value_setter_same_state_and_delete(self):
+        state = _utils.ThreadState('disabled', 'internal')
+        state.value = 'disabled'
+        assert state.value == 'disabled'
+        state.value = ''.join(['inter', 'nal'])
+        state.value = 'internal'
+        assert state.value == 'internal'
+        with pytest.raises(TypeError):
+            state.value = 'missing'
+        with pytest.raises(AttributeError):
+            del state.value
+        assert state.value == 'internal'
+        state.value = 'disabled'
+
     def test_select_context_manager(self):
         state = _utils.ThreadState('disabled', 'internal', 'external')
         assert state.value == 'disabled'
@@ -985,6 +1205,44 @@ class TestThreadState:
 
         assert state.value == 'disabled'
 
+    def test_select_nested_with_many_states(self):
+        names = [f's{i}' for i in range(12)]
+        state = _utils.ThreadState(*names)
+
+        def nest(remaining):
+            if not remaining:
+                return
+            previous = state.value
+            with state.select(remaining[0]):
+                assert state.value == remaining[0]
+                nest(remaining[1:])
+            assert state.value == previous
+
+        nest(names[::-1])
+        assert state.value == 's0'
+
+    def test_released_select_context_is_recycled(self):
+        state = _utils.ThreadState('disabled', 'internal', 'external')
+
+        ctx = state.select('internal')
+        address = id(ctx)
+        del ctx
+
+        recycled = state.select('external')
+        assert id(recycled) == address
+        with recycled:
+            assert state.value == 'external'
+        assert state.value == 'disabled'
+
+    def test_select_exit_requires_three_arguments(self):
+        state = _utils.ThreadState('disabled', 'internal')
+
+        ctx = state.select('internal')
+        ctx.__enter__()
+        with pytest.raises(TypeError):
+            ctx.__exit__(None)
+        assert state.value == 'disabled'
+
     def test_predicate_matches_current_state(self):
         state = _utils.ThreadState('disabled', 'internal', 'external')
 
@@ -1036,6 +1294,17 @@ class TestDispatch:
         d = state.dispatch(lambda: 'default', b=lambda: 'b')
         assert d is not None
 
+    def test_recreated_dispatches_route_correctly(self):
+        state = _utils.ThreadState('a', 'b')
+        for i in range(200):
+            d = state.dispatch(lambda: 'a', b=lambda i=i: i)
+            m = state.method_dispatch(lambda: 'm')
+            assert type(m) is not type(d)
+            assert d() == 'a'
+            with state.select('b'):
+                assert d() == i
+            del d, m
+
     def test_missing_state_and_no_default_raises(self):
         state = _utils.ThreadState('a', 'b', 'c')
         with pytest.raises(TypeError):
@@ -1135,6 +1404,16 @@ class TestDispatch:
         assert table['disabled'] is handler_d
         assert table['internal'] is handler_i
 
+    def test_state_names_built_at_runtime_match(self):
+        prefix = 'inter'
+        state = _utils.ThreadState('disabled', prefix + 'nal')
+
+        d = state.dispatch(lambda: 'default', **{''.join(['inter', 'nal']): lambda: 'internal'})
+
+        with state.select(''.join(['inter', 'nal'])):
+            assert d() == 'internal'
+        assert list(_utils.dispatch.table(d)) == ['disabled', 'internal']
+
     def test_table_default_appears_for_unspecified(self):
         state = _utils.ThreadState('disabled', 'internal', 'external')
 
@@ -1190,6 +1469,28 @@ class TestDispatch:
         assert d() == 'old_internal'
         state.value = 'disabled'
 
+    def test_table_reflects_set_dispatch_and_is_a_copy(self):
+        state = _utils.ThreadState('disabled', 'internal')
+        original = lambda: 'original'
+        d = state.dispatch(original)
+
+        table = _utils.dispatch.table(d)
+        table['disabled'] = None
+        assert _utils.dispatch.table(d)['disabled'] is original
+
+        replacement = lambda: 'new'
+        state.set_dispatch(d, internal=replacement)
+        assert _utils.dispatch.table(d) == {'disabled': original, 'internal': replacement}
+
+    def test_set_dispatch_rejects_dispatch_from_other_state(self):
+        state = _utils.ThreadState('disabled', 'internal')
+        other = _utils.ThreadState('a', 'b', 'c')
+
+        d = other.dispatch(lambda: 'default')
+
+        with pytest.raises(TypeError):
+            state.set_dispatch(d, disabled=lambda: 'new')
+
     def test_method_dispatch_creation_and_table(self):
         state = _utils.ThreadState('disabled', 'internal')
 
@@ -1212,6 +1513,37 @@ class TestDispatch:
         )
         assert isinstance(d, _utils.dispatch)
 
+    def test_method_dispatch_binds_self(self):
+        state = _utils.ThreadState('disabled', 'internal')
+
+        class Target:
+            method = state.method_dispatch(
+                disabled=lambda self, x, y=1: ('disabled', self, x, y),
+                internal=lambda self, x, y=1: ('internal', self, x, y),
+            )
+
+        obj = Target()
+
+        assert Target.__dict__['method'] is Target.method
+        assert obj.method(2) == ('disabled', obj, 2, 1)
+
+        bound = obj.method
+        state.value = 'internal'
+        assert obj.method(2, y=3) == ('internal', obj, 2, 3)
+        assert bound(4) == ('internal', obj, 4, 1)
+        state.value = 'disabled'
+
+    def test_dispatch_types_are_final(self):
+        state = _utils.ThreadState('disabled', 'internal')
+        d = state.dispatch(len)
+        m = state.method_dispatch(len)
+
+        assert not _utils.is_extendable(type(d))
+        assert not _utils.is_extendable(type(m))
+        assert isinstance(m, type(d))
+        with pytest.raises(TypeError):
+            type(d).extra = None
+
     def test_dispatch_repr(self):
         state = _utils.ThreadState('disabled', 'internal')
 
@@ -1223,6 +1555,22 @@ class TestDispatch:
         r = repr(d)
         assert 'Dispatch' in r
 
+    def test_dispatch_repr_propagates_handler_repr_errors(self):
+        state = _utils.ThreadState('disabled', 'internal')
+
+        class BadRepr:
+            def __call__(self):
+                return None
+
+            def __repr__(self):
+                raise ValueError('no repr')
+
+        d = state.dispatch(BadRepr(), internal=len)
+        assert 'internal = <built-in function len>' in repr(state.dispatch(len))
+
+        with pytest.raises(ValueError):
+            repr(d)
+
 
 # ============================================================================
 # Wrapped / unwrap tests
@@ -1258,6 +1606,20 @@ class TestWrappedUnwrap:
         assert calls[0][1] is original
         assert calls[0][2] == (5,)
 
+    def test_wrapped_function_forwards_kwargs_without_offset_slot(self):
+        import functools
+
+        def original(x, y=0):
+            return (x, y)
+
+        def handler(target, *args, **kwargs):
+            return target(*args, **kwargs)
+
+        wf = _utils.wrapped_function(target=original, handler=handler)
+        assert wf(1, y=2) == (1, 2)
+        # functools.partial vectorcalls without PY_VECTORCALL_ARGUMENTS_OFFSET
+        assert functools.partial(wf, 1)(y=2) == (1, 2)
+
     def test_try_unwrap_wrapped_function(self):
         def original(x):
             return x + 1
@@ -1330,6 +1692,11 @@ class TestWrappedUnwrap:
         assert not _utils.is_wrapped(42)
         assert not _utils.is_wrapped(lambda: None)
 
+    def test_wrapped_leaf_types_are_final(self):
+        """is_wrapped relies on exact type checks for these leaf types."""
+        assert not _utils.is_extendable(_utils.wrapped_function)
+        assert not _utils.is_extendable(_utils.wrapped_member)
+
     def test_unwrap_apply_calls_original_target(self):
         """unwrap_apply(wrapped, *args) calls the original target directly."""
         calls = []
@@ -1349,6 +1716,13 @@ class TestWrappedUnwrap:
         assert result == 7
         assert calls == [('original', 3, 4)]  # handler was NOT called
 
+    def test_unwrap_apply_forwards_keywords(self):
+        wf = _utils.wrapped_function(target=lambda x, y=0: (x, y), handler=None)
+
+        assert _utils.unwrap_apply(wf, 1, y=2) == (1, 2)
+        with pytest.raises(TypeError):
+            _utils.unwrap_apply(len, 1)
+
     def test_dispatch_table_extracts_original_from_proxy_pattern(self):
         """Simulate the proxy pattern: dispatch(original, internal=wrapped).
 
@@ -1403,6 +1777,8 @@ class TestGateCreation:
             _utils.Gate(1)
         with pytest.raises(TypeError):
             _utils.Gate(x=1)
+        with pytest.raises(TypeError):
+            _utils.Gate(_utils.noop)  # default is keyword-only
 
     def test_default_executor(self):
         """Gate(default=callable) uses that executor when no thread-local is set."""
@@ -1411,6 +1787,12 @@ class TestGateCreation:
         bound = gate.bind(lambda: 42)
         assert bound() is None  # noop ignores target and returns None
 
+    def test_reinit_is_rejected(self):
+        gate = _utils.Gate(default=_utils.noop)
+        with pytest.raises(TypeError):
+            gate.__init__(default=None)
+        assert gate.executor is _utils.noop
+
     def test_default_pass_through(self):
         """Gate(default=pass_through) forwards to target when no thread-local set."""
         pass_through = lambda target, *args, **kwargs: target(*args, **kwargs)
@@ -1439,6 +1821,14 @@ class TestGateCreation:
         with pytest.raises(TypeError):
             _utils.Gate(default=42)
 
+    def test_gate_types_are_immutable(self):
+        gate = _utils.Gate()
+        for obj in (gate, gate.bind(len), gate.context(None),
+                    gate.apply_with(None), gate.test(None)):
+            with pytest.raises(TypeError):
+                type(obj).extra = None
+            assert not _utils.is_extendable(type(obj))
+
 
 class TestGateSetDisable:
     """Tests for Gate.set() and Gate.disable()."""
@@ -1564,6 +1954,45 @@ class TestGateBind:
         assert bound(3) == 13
         assert bound(3, y=5) == 8
 
+    def test_bound_called_without_offset_slot(self):
+        import functools
+
+        gate = _utils.Gate()
+        bound = gate.bind(lambda x, y=10: (x, y))
+
+        def executor(target, *args, **kwargs):
+            return ('exec',) + target(*args, **kwargs)
+
+        # functools.partial vectorcalls without PY_VECTORCALL_ARGUMENTS_OFFSET
+        assert functools.partial(bound, 3)(y=5) == (3, 5)
+        gate.set(executor)
+        assert functools.partial(bound, 3)(y=5) == ('exec', 3, 5)
+        assert functools.partial(bound, 3)() == ('exec', 3, 10)
+
+    def test_rebinding_many_targets(self):
+        gate = _utils.Gate()
+        for i in range(300):
+            bound = [gate.bind(lambda i=i, j=j: (i, j)) for j in range(3)]
+            assert [b() for b in bound] == [(i, 0), (i, 1), (i, 2)]
+            assert bound[1].__wrapped__() == (i, 1)
+
+    def test_bound_gate_cycle_is_collected(self):
+        import gc
+        import weakref
+
+        gate = _utils.Gate()
+        holder = []
+
+        def target():
+            return holder[0]
+
+        holder.append(gate.bind(target))
+        ref = weakref.ref(target)
+
+        del target, holder
+        gc.collect()
+        assert ref() is None
+
     def test_bound_repr(self):
         gate = _utils.Gate()
         target = lambda x: x
@@ -1601,6 +2030,28 @@ class TestGateBind:
         assert calls == ['func_a', 'func_b']
 
 
+class TestGateManyGates:
+    """Several gates in use at once keep independent executors."""
+
+    def test_interleaved_gates(self):
+        gates = [_utils.Gate() for _ in range(20)]
+        bound = [gate.bind(lambda i=i: i) for i, gate in enumerate(gates)]
+
+        def executor(target, *args, **kwargs):
+            return ('exec', target(*args, **kwargs))
+
+        for gate in gates[::2]:
+            gate.set(executor)
+
+        for _ in range(3):
+            for i, b in enumerate(bound):
+                assert b() == (('exec', i) if i % 2 == 0 else i)
+
+        for gate in gates[::2]:
+            gate.disable()
+        assert [b() for b in bound] == list(range(20))
+
+
 class TestGateCall:
     """Tests for gate(*args) dispatching to executor."""
 
@@ -1728,6 +2179,29 @@ class TestGateContextManager:
         with pytest.raises(TypeError):
             gate.context(42)
 
+    def test_released_context_is_recycled(self):
+        gate = _utils.Gate()
+        executor = lambda target, *a, **kw: target(*a, **kw)
+
+        ctx = gate.context(None)
+        address = id(ctx)
+        del ctx
+
+        recycled = gate.context(executor)
+        assert id(recycled) == address
+        with recycled:
+            assert gate.executor is executor
+        assert gate.executor is None
+
+    def test_exit_requires_three_arguments(self):
+        gate = _utils.Gate()
+
+        ctx = gate.context(lambda target, *a, **kw: target(*a, **kw))
+        ctx.__enter__()
+        with pytest.raises(TypeError):
+            ctx.__exit__()
+        assert gate.executor is None
+
 
 class TestGateThreadIsolation:
     """Tests that Gate executor is per-thread."""
@@ -1972,6 +2446,24 @@ class TestApplyWith:
         # Original executor is restored despite the exception
         assert gate.executor is original_exec
 
+    def test_apply_with_same_executor_nested_and_restored(self):
+        gate = _utils.Gate()
+        executor = lambda target, *a, **kw: target(*a, **kw)
+        other = lambda target, *a, **kw: target(*a, **kw)
+        aw = gate.apply_with(executor)
+
+        def inner():
+            assert gate.executor is executor
+            gate.set(other)
+            return 'inner'
+
+        assert aw(aw, inner) == 'inner'
+        assert gate.executor is None
+
+        gate.set(executor)
+        assert aw(inner) == 'inner'
+        assert gate.executor is executor
+
     def test_apply_with_kwargs(self):
         """Keyword arguments are forwarded correctly."""
         gate = _utils.Gate()